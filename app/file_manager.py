@@ -3,11 +3,26 @@ FileManager class for handling file operations.
 Handles scanning, deletion, and moving of files.
 """
 
+import os
+import stat
+import time
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime
 import shutil
+from functools import lru_cache
+from typing import NamedTuple
 from send2trash import send2trash
-import config
+from config import CONFIG
+
+# Units for format_file_size, one per power of 1024
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
+class FileRow(NamedTuple):
+    """A scanned file together with the stat fields the UI needs."""
+    path: str
+    size: int
+    ctime_ns: int
 
 
 class FileManager:
@@ -18,10 +33,10 @@ class FileManager:
         Initialize FileManager.
         
         Args:
-            downloads_path: Path to Downloads folder. If None, uses config.DOWNLOADS_PATH.
+            downloads_path: Path to Downloads folder. If None, uses CONFIG.downloads_path.
         """
         if downloads_path is None:
-            self.downloads_path = config.DOWNLOADS_PATH
+            self.downloads_path = CONFIG.downloads_path
         else:
             self.downloads_path = Path(downloads_path)
     
@@ -30,46 +45,61 @@ class FileManager:
         Scan Downloads folder and return files created in the last N hours.
         
         Args:
-            hours: Number of hours to look back (default: config.HOURS_THRESHOLD)
+            hours: Number of hours to look back (default: CONFIG.hours_threshold)
             
         Returns:
-            List of Path objects for files created in the last N hours, sorted by creation time (newest first)
+            List of FileRow records (path, size, ctime_ns) for files created in the last N hours,
+            sorted by creation time (newest first)
         """
         if hours is None:
-            hours = config.HOURS_THRESHOLD
+            hours = CONFIG.hours_threshold
         
         recent_files = []
-        cutoff_time = datetime.now() - timedelta(hours=hours)
+        # Integer nanosecond cutoff, so the loop compares ints instead of datetimes
+        cutoff_ns = time.time_ns() - int(hours * 3_600_000_000_000)
         
         try:
-            if not self.downloads_path.exists():
+            # A single scandir pass: DirEntry.is_file() usually comes free from
+            # readdir and DirEntry.stat() is cached, so each file costs one stat.
+            # Paths stay plain strings; callers wrap them in Path when needed.
+            # A missing folder is reported by scandir itself, saving an exists() call.
+            try:
+                entries = os.scandir(self.downloads_path)
+            except FileNotFoundError:
                 raise FileNotFoundError(
                     f"Downloads folder not found at: {self.downloads_path}"
                 )
             
-            for item in self.downloads_path.iterdir():
-                # Only process files, not directories
-                if item.is_file():
+            with entries:
+                for entry in entries:
                     try:
+                        # Only process files, not directories
+                        if not entry.is_file(follow_symlinks=False):
+                            continue
+                        
                         # Get file creation time (Windows)
-                        creation_time = datetime.fromtimestamp(item.stat().st_ctime)
+                        file_stat = entry.stat()
                         
-                        if creation_time >= cutoff_time:
-                            recent_files.append(item)
+                        if file_stat.st_ctime_ns >= cutoff_ns:
+                            recent_files.append(
+                                FileRow(entry.path, file_stat.st_size, file_stat.st_ctime_ns)
+                            )
                     except (OSError, PermissionError) as e:
                         # Skip files that can't be accessed
-                        print(f"Error accessing {item.name}: {e}")
+                        print(f"Error accessing {entry.name}: {e}")
                         continue
             
             # Sort by creation time (newest first)
-            recent_files.sort(key=lambda x: x.stat().st_ctime, reverse=True)
+            recent_files.sort(key=lambda row: row.ctime_ns, reverse=True)
             
         except Exception as e:
             raise Exception(f"Error scanning Downloads folder: {e}")
         
         return recent_files
     
-    def format_file_size(self, size_bytes):
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def format_file_size(size_bytes):
         """
         Convert bytes to human-readable format.
         
@@ -79,11 +109,11 @@ class FileManager:
         Returns:
             Formatted string (e.g., "1.23 MB")
         """
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.2f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.2f} TB"
+        # bit_length gives log2 of the size, so dividing by 10 picks the 1024 power
+        unit_index = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        if unit_index <= 0:
+            return f"{size_bytes:.2f} B"
+        return f"{size_bytes / (1 << (10 * unit_index)):.2f} {_SIZE_UNITS[unit_index]}"
     
     def delete_file(self, file_path):
         """
@@ -118,6 +148,47 @@ class FileManager:
             else:
                 raise Exception(f"Failed to delete file: {error_msg}")
     
+    def delete_files(self, file_paths):
+        """
+        Delete several files to Recycle Bin in one operation.
+        
+        send2trash accepts a list and, on Windows, queues every path on a single
+        IFileOperation, so COM setup and the shell round trip happen once per
+        batch instead of once per file.
+        
+        Args:
+            file_paths: Iterable of Path objects or string paths
+            
+        Returns:
+            True if successful
+            
+        Raises:
+            FileNotFoundError: If any of the files doesn't exist
+            PermissionError: If a file cannot be deleted (e.g., file is open)
+            Exception: For other deletion errors
+        """
+        file_paths = [Path(file_path) for file_path in file_paths]
+        if not file_paths:
+            return True
+        
+        for file_path in file_paths:
+            if not file_path.exists():
+                raise FileNotFoundError(f"File not found: {file_path}")
+        
+        try:
+            send2trash([str(file_path) for file_path in file_paths])
+            return True
+        except Exception as e:
+            error_msg = str(e)
+            if "Permission denied" in error_msg or "access" in error_msg.lower():
+                raise PermissionError(
+                    "Cannot delete some of the files. "
+                    "They may be open in another program. "
+                    "Please close them and try again."
+                )
+            else:
+                raise Exception(f"Failed to delete files: {error_msg}")
+    
     def move_file(self, file_path, destination_folder, overwrite=False):
         """
         Move a file to a destination folder.
@@ -139,27 +210,38 @@ class FileManager:
         file_path = Path(file_path)
         destination_path = Path(destination_folder)
         
-        if not file_path.exists():
+        try:
+            source_stat = file_path.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {file_path}")
         
-        if not destination_path.exists():
+        try:
+            destination_stat = destination_path.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(f"Destination folder not found: {destination_path}")
         
-        if not destination_path.is_dir():
+        if not stat.S_ISDIR(destination_stat.st_mode):
             raise ValueError(f"Destination is not a directory: {destination_path}")
         
         destination_file = destination_path / file_path.name
         
-        # Check if file already exists in destination
-        if destination_file.exists() and not overwrite:
-            raise FileExistsError(
-                f"'{file_path.name}' already exists in the destination folder."
-            )
-        
         try:
+            # Same volume: a rename is a single atomic syscall with no data copy
+            if source_stat.st_dev == destination_stat.st_dev:
+                self._rename_file(file_path, destination_file, overwrite)
+                return destination_file
+            
+            # Check if file already exists in destination
+            if destination_file.exists() and not overwrite:
+                raise FileExistsError(
+                    f"'{file_path.name}' already exists in the destination folder."
+                )
+            
             # Move the file
             shutil.move(str(file_path), str(destination_file))
             return destination_file
+        except FileExistsError:
+            raise
         except PermissionError:
             raise PermissionError(
                 f"Cannot move '{file_path.name}'. "
@@ -169,12 +251,41 @@ class FileManager:
         except Exception as e:
             raise Exception(f"Failed to move file: {str(e)}")
     
+    def _rename_file(self, file_path, destination_file, overwrite):
+        """
+        Move a file within one volume by renaming it.
+        
+        On Windows os.rename refuses to replace an existing file, so the rename
+        itself detects an existing destination instead of a separate exists() check.
+        
+        Raises:
+            FileExistsError: If destination file exists and overwrite=False
+            PermissionError: If file cannot be moved (e.g., file is open)
+        """
+        if overwrite:
+            os.replace(file_path, destination_file)
+            return
+        
+        # POSIX rename silently replaces the destination, so check first there
+        if os.name != 'nt' and destination_file.exists():
+            raise FileExistsError(
+                f"'{file_path.name}' already exists in the destination folder."
+            )
+        
+        try:
+            os.rename(file_path, destination_file)
+        except FileExistsError:
+            raise FileExistsError(
+                f"'{file_path.name}' already exists in the destination folder."
+            )
+    
     def get_file_info(self, file_path):
         """
         Get file information (size, creation time).
         
         Args:
-            file_path: Path object or string path to the file
+            file_path: Path object or string path to the file, or a FileRow from
+                get_recent_files (its cached size and ctime are used without a stat)
             
         Returns:
             Dictionary with 'size', 'size_formatted', 'creation_time', 'creation_time_str'
@@ -182,11 +293,15 @@ class FileManager:
         Raises:
             OSError: If file cannot be accessed
         """
-        file_path = Path(file_path)
-        file_stat = file_path.stat()
+        if isinstance(file_path, FileRow):
+            size_bytes = file_path.size
+            creation_ns = file_path.ctime_ns
+        else:
+            file_stat = Path(file_path).stat()
+            size_bytes = file_stat.st_size
+            creation_ns = file_stat.st_ctime_ns
         
-        size_bytes = file_stat.st_size
-        creation_time = datetime.fromtimestamp(file_stat.st_ctime)
+        creation_time = datetime.fromtimestamp(creation_ns / 1e9)
         
         return {
             'size': size_bytes,
@@ -3,9 +3,20 @@ PreviewGenerator class for generating previews of various file types.
 Handles images, PDFs, videos, and application icons.
 """
 
+import os
+import functools
+import hashlib
+import itertools
+import queue
+import shutil
+import subprocess
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from PIL import Image
 import io
+from config import CONFIG
 
 # Try to import optional dependencies
 try:
@@ -22,97 +33,429 @@ try:
 except ImportError:
     ICON_SUPPORT = False
 
+try:
+    import ctypes
+    from ctypes import wintypes
+    
+    _ole32 = ctypes.windll.ole32
+    _shell32 = ctypes.windll.shell32
+    _user32 = ctypes.windll.user32
+    _gdi32 = ctypes.windll.gdi32
+    
+    class _GUID(ctypes.Structure):
+        _fields_ = [
+            ("Data1", wintypes.DWORD),
+            ("Data2", wintypes.WORD),
+            ("Data3", wintypes.WORD),
+            ("Data4", ctypes.c_ubyte * 8),
+        ]
+    
+    class _BITMAPINFOHEADER(ctypes.Structure):
+        _fields_ = [
+            ("biSize", wintypes.DWORD),
+            ("biWidth", wintypes.LONG),
+            ("biHeight", wintypes.LONG),
+            ("biPlanes", wintypes.WORD),
+            ("biBitCount", wintypes.WORD),
+            ("biCompression", wintypes.DWORD),
+            ("biSizeImage", wintypes.DWORD),
+            ("biXPelsPerMeter", wintypes.LONG),
+            ("biYPelsPerMeter", wintypes.LONG),
+            ("biClrUsed", wintypes.DWORD),
+            ("biClrImportant", wintypes.DWORD),
+        ]
+    
+    # Handles are pointer-sized, so declare signatures to avoid 64-bit truncation
+    _ole32.CoInitializeEx.argtypes = [ctypes.c_void_p, wintypes.DWORD]
+    _ole32.CoInitializeEx.restype = ctypes.c_long
+    _ole32.IIDFromString.argtypes = [wintypes.LPCWSTR, ctypes.POINTER(_GUID)]
+    _shell32.SHCreateItemFromParsingName.argtypes = [
+        wintypes.LPCWSTR, ctypes.c_void_p, ctypes.POINTER(_GUID), ctypes.POINTER(ctypes.c_void_p)
+    ]
+    _shell32.SHCreateItemFromParsingName.restype = ctypes.c_long
+    _user32.GetDC.argtypes = [wintypes.HWND]
+    _user32.GetDC.restype = wintypes.HDC
+    _user32.ReleaseDC.argtypes = [wintypes.HWND, wintypes.HDC]
+    _gdi32.GetDIBits.argtypes = [
+        wintypes.HDC, wintypes.HBITMAP, wintypes.UINT, wintypes.UINT,
+        ctypes.c_void_p, ctypes.POINTER(_BITMAPINFOHEADER), wintypes.UINT
+    ]
+    _gdi32.DeleteObject.argtypes = [wintypes.HGDIOBJ]
+    
+    # IShellItemImageFactory::GetImage(SIZE, SIIGBF, HBITMAP*) is vtable slot 3
+    _GetImage = ctypes.WINFUNCTYPE(
+        ctypes.HRESULT, ctypes.c_void_p, wintypes.SIZE, ctypes.c_int, ctypes.POINTER(wintypes.HBITMAP)
+    )(3, "GetImage")
+    # IUnknown::Release is vtable slot 2
+    _Release = ctypes.WINFUNCTYPE(ctypes.c_ulong, ctypes.c_void_p)(2, "Release")
+    _IID_IShellItemImageFactory = _GUID()
+    _ole32.IIDFromString("{bcc18b79-ba16-442f-80c4-8a59c30c463b}", ctypes.byref(_IID_IShellItemImageFactory))
+    SHELL_IMAGE_SUPPORT = True
+except (ImportError, AttributeError, OSError):
+    SHELL_IMAGE_SUPPORT = False
+
 try:
     import cv2
     VIDEO_SUPPORT = True
 except ImportError:
     VIDEO_SUPPORT = False
 
+# ffmpeg can seek and scale in C, which is much cheaper than decoding a full frame in OpenCV
+FFMPEG_PATH = shutil.which("ffmpeg")
+
+# Supported extensions by preview kind
+# Note: SVG requires special handling, so we'll skip it for now
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.ico', '.webp', '.tiff', '.tif'})
+PDF_EXTENSIONS = frozenset({'.pdf'})
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm', '.m4v'})
+EXECUTABLE_EXTENSIONS = frozenset({'.exe', '.msi', '.app', '.dmg', '.deb', '.rpm', '.pkg'})
+
+# Single lookup table from extension to preview kind
+_EXT_KIND = {
+    **dict.fromkeys(IMAGE_EXTENSIONS, 'image'),
+    **dict.fromkeys(PDF_EXTENSIONS, 'pdf'),
+    **dict.fromkeys(VIDEO_EXTENSIONS, 'video'),
+    **dict.fromkeys(EXECUTABLE_EXTENSIONS, 'exe'),
+}
+
+
+def _extension(file_path):
+    """Lower-cased extension of a str or Path, without building a Path object."""
+    return os.path.splitext(file_path)[1].lower()
+
+
+def _cached_preview(generate):
+    """
+    Decorator that puts the thumbnail caches in front of a get_*_preview method.
+    
+    Previews are keyed on the file's path, size, mtime and the requested size, so
+    a changed file is regenerated automatically. Files that failed to preview are
+    remembered by (path, mtime) and not retried until they change.
+    """
+    default_size = generate.__defaults__[-1]
+    
+    @functools.wraps(generate)
+    def wrapper(self, file_path, max_size=None):
+        if max_size is None:
+            max_size = default_size
+        
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            return generate(self, file_path, max_size)
+        
+        failure_key = (str(file_path), file_stat.st_mtime_ns)
+        if failure_key in self._failed_previews:
+            return None
+        
+        key = hashlib.blake2b(
+            f"{generate.__name__}|{file_path}|{file_stat.st_size}|"
+            f"{file_stat.st_mtime_ns}|{max_size}".encode(),
+            digest_size=16
+        ).hexdigest()
+        with self._cache_lock:
+            self._path_keys.setdefault(str(file_path), set()).add(key)
+        
+        img = self._load_cached_preview(key)
+        if img is None:
+            img = generate(self, file_path, max_size)
+            if img is not None:
+                self._store_cached_preview(key, img)
+            else:
+                self._remember_failure(failure_key)
+        return img
+    
+    return wrapper
+
 
 class PreviewGenerator:
     """Generates preview images for various file types."""
     
-    def __init__(self):
-        """Initialize PreviewGenerator."""
+    # Number of decoded previews kept in memory
+    _MEMORY_CACHE_MAX = 256
+    # Number of failed previews remembered so they aren't retried
+    _FAILURE_CACHE_MAX = 4096
+    # Size the thumbnail folder is pruned back to when the app starts
+    _DISK_CACHE_MAX_BYTES = 100 * 1024 * 1024
+    
+    def __init__(self, cache_path=None):
+        """
+        Initialize PreviewGenerator.
+        
+        Args:
+            cache_path: Folder for cached thumbnails. If None, uses CONFIG.thumbnail_cache_path.
+        """
         self.pdf_support = PDF_SUPPORT
-        self.icon_support = ICON_SUPPORT
-        self.video_support = VIDEO_SUPPORT
+        self.icon_support = ICON_SUPPORT or SHELL_IMAGE_SUPPORT
+        self.ffmpeg_path = FFMPEG_PATH
+        self.video_support = VIDEO_SUPPORT or FFMPEG_PATH is not None
+        
+        # Worker pool for background previews. PIL, PyMuPDF and OpenCV release
+        # the GIL while decoding, so threads keep the UI responsive.
+        self._max_workers = min(8, os.cpu_count() or 4)
+        self._pool = ThreadPoolExecutor(max_workers=self._max_workers)
+        # In-flight preview futures, one per requesting widget/key
+        self._pending = {}
+        
+        # Prioritized pre-warming: a bounded queue drained by a scheduler thread
+        # that only hands a job to the pool when a worker is free
+        self._queue = queue.PriorityQueue(maxsize=2 * self._max_workers)
+        self._queue_order = itertools.count()
+        self._free_workers = threading.Semaphore(self._max_workers)
+        self._requested = {}
+        self._requested_lock = threading.Lock()
+        self._scheduler = None
+        
+        # Thumbnail caches: decoded images in memory, WEBP files on disk
+        self._memory_cache = OrderedDict()
+        self._failed_previews = {}
+        # Cache keys used for each file this session, so forget() can find them
+        self._path_keys = {}
+        self._cache_lock = threading.Lock()
+        self.cache_path = Path(cache_path) if cache_path is not None else CONFIG.thumbnail_cache_path
+        try:
+            self.cache_path.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            # Run without the disk cache if the folder can't be created
+            self.cache_path = None
+        else:
+            self._pool.submit(self._prune_disk_cache)
+        
+        # PyMuPDF is not thread-safe, so all PDF work holds the lock
+        self._pdf_lock = threading.Lock()
+        
+        # Preview method for each extension we can actually preview, so
+        # unsupported types are rejected by the same single lookup
+        preview_methods = {'image': self.get_image_preview}
+        if self.pdf_support:
+            preview_methods['pdf'] = self.get_pdf_preview
+        if self.video_support:
+            preview_methods['video'] = self.get_video_preview
+        if self.icon_support:
+            preview_methods['exe'] = self.get_app_icon
+        self._dispatch = {
+            extension: preview_methods[kind]
+            for extension, kind in _EXT_KIND.items()
+            if kind in preview_methods
+        }
+    
+    def _load_cached_preview(self, key):
+        """Return a cached preview for a key from memory or disk, or None."""
+        with self._cache_lock:
+            img = self._memory_cache.get(key)
+            if img is not None:
+                self._memory_cache.move_to_end(key)
+                return img
+        
+        if self.cache_path is None:
+            return None
+        
+        cache_file = self.cache_path / f"{key}.webp"
+        try:
+            img = Image.open(cache_file)
+            img.load()
+        except (OSError, ValueError):
+            return None
+        
+        # Bump the mtime so pruning drops the least recently used thumbnails
+        try:
+            os.utime(cache_file)
+        except OSError:
+            pass
+        
+        self._remember_preview(key, img)
+        return img
+    
+    def _store_cached_preview(self, key, img):
+        """Save a generated preview to the memory and disk caches."""
+        self._remember_preview(key, img)
+        
+        if self.cache_path is None:
+            return
+        
+        # Write to a temporary file first so readers never see a partial thumbnail
+        target = self.cache_path / f"{key}.webp"
+        temp = self.cache_path / f"{key}.{threading.get_ident()}.tmp"
+        try:
+            img.save(temp, "WEBP", quality=80)
+            os.replace(temp, target)
+        except (OSError, ValueError):
+            try:
+                temp.unlink()
+            except OSError:
+                pass
+    
+    def _prune_disk_cache(self):
+        """Delete the oldest thumbnails until the disk cache fits its size limit."""
+        thumbnails = []
+        total_size = 0
+        try:
+            with os.scandir(self.cache_path) as entries:
+                for entry in entries:
+                    try:
+                        file_stat = entry.stat()
+                    except OSError:
+                        continue
+                    if entry.name.endswith(".tmp"):
+                        # Left behind by an interrupted write
+                        thumbnails.append((0, 0, entry.path))
+                        continue
+                    thumbnails.append((file_stat.st_mtime_ns, file_stat.st_size, entry.path))
+                    total_size += file_stat.st_size
+        except OSError:
+            return
+        
+        thumbnails.sort()
+        for mtime_ns, size, path in thumbnails:
+            if mtime_ns and total_size <= self._DISK_CACHE_MAX_BYTES:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total_size -= size
+    
+    def forget(self, file_path):
+        """
+        Drop the cached previews of a file, e.g. after it was deleted or moved.
+        
+        Args:
+            file_path: Path to the file
+        """
+        file_path = str(file_path)
+        with self._cache_lock:
+            keys = self._path_keys.pop(file_path, ())
+            for key in keys:
+                self._memory_cache.pop(key, None)
+            for failure_key in [k for k in self._failed_previews if k[0] == file_path]:
+                del self._failed_previews[failure_key]
+        
+        if self.cache_path is None:
+            return
+        for key in keys:
+            try:
+                (self.cache_path / f"{key}.webp").unlink()
+            except OSError:
+                pass
+    
+    def _remember_preview(self, key, img):
+        """Add a preview to the in-memory LRU cache."""
+        with self._cache_lock:
+            self._memory_cache[key] = img
+            self._memory_cache.move_to_end(key)
+            if len(self._memory_cache) > self._MEMORY_CACHE_MAX:
+                self._memory_cache.popitem(last=False)
+    
+    def _remember_failure(self, failure_key):
+        """Record a failed preview, evicting the oldest entry when full."""
+        with self._cache_lock:
+            self._failed_previews[failure_key] = None
+            if len(self._failed_previews) > self._FAILURE_CACHE_MAX:
+                del self._failed_previews[next(iter(self._failed_previews))]
     
     def is_image_file(self, file_path):
         """Check if a file is an image based on extension."""
-        # Note: SVG requires special handling, so we'll skip it for now
-        image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.ico', '.webp', '.tiff', '.tif'}
-        return file_path.suffix.lower() in image_extensions
+        return _extension(file_path) in IMAGE_EXTENSIONS
     
     def is_pdf_file(self, file_path):
         """Check if a file is a PDF."""
-        return file_path.suffix.lower() == '.pdf'
+        return _extension(file_path) in PDF_EXTENSIONS
     
     def is_executable_file(self, file_path):
         """Check if a file is an executable/application."""
-        exe_extensions = {'.exe', '.msi', '.app', '.dmg', '.deb', '.rpm', '.pkg'}
-        return file_path.suffix.lower() in exe_extensions
+        return _extension(file_path) in EXECUTABLE_EXTENSIONS
     
     def is_video_file(self, file_path):
         """Check if a file is a video."""
-        video_extensions = {'.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm', '.m4v'}
-        return file_path.suffix.lower() in video_extensions
+        return _extension(file_path) in VIDEO_EXTENSIONS
     
+    @_cached_preview
     def get_image_preview(self, file_path, max_size=(500, 200)):
         """Get image preview from image file."""
         try:
             img = Image.open(file_path)
+            original_size = img.size
+            
+            # Size the image will actually be fitted to inside max_size
+            scale = min(max_size[0] / original_size[0], max_size[1] / original_size[1], 1.0)
+            fitted_size = (
+                max(1, round(original_size[0] * scale)),
+                max(1, round(original_size[1] * scale))
+            )
+            
+            # Let libjpeg decode JPEGs at 1/2, 1/4 or 1/8 scale in the DCT domain,
+            # keeping at least twice the fitted size (no-op for other formats)
+            img.draft('RGB', (fitted_size[0] * 2, fitted_size[1] * 2))
+            img.load()
+            # draft() returns a truthy value even at scale 1, so compare sizes
+            drafted = img.size != original_size
+            
+            # Normalize modes that don't resample well, keeping any alpha channel
+            if img.mode == 'P':  # Palette mode
+                img = img.convert('RGBA' if 'transparency' in img.info else 'RGB')
+            elif img.mode not in ('RGB', 'RGBA', 'L'):  # L is grayscale
+                img = img.convert('RGBA' if 'A' in img.getbands() else 'RGB')
+            
+            # Resize maintaining aspect ratio. After a DCT-domain draft the
+            # remaining reduction is 2-4x (more only for images past the 1/8
+            # limit), where BILINEAR, whose kernel widens when shrinking, is enough.
+            resample = Image.Resampling.BILINEAR if drafted else Image.Resampling.LANCZOS
+            img.thumbnail(max_size, resample)
             
-            # Handle different image modes
+            # Flatten transparency onto white after resizing, so the
+            # background is only allocated at thumbnail size
             if img.mode == 'RGBA':
-                # Create white background for transparency
-                background = Image.new('RGB', img.size, (255, 255, 255))
-                if img.mode == 'RGBA':
-                    background.paste(img, mask=img.split()[3])
-                img = background
-            elif img.mode == 'P':  # Palette mode
-                img = img.convert('RGB')
-            elif img.mode not in ('RGB', 'L'):  # L is grayscale
-                img = img.convert('RGB')
+                background = Image.new('RGBA', img.size, (255, 255, 255, 255))
+                img = Image.alpha_composite(background, img).convert('RGB')
             
-            # Resize maintaining aspect ratio
-            img.thumbnail(max_size, Image.Resampling.LANCZOS)
             return img
         except Exception as e:
             return None
     
+    @_cached_preview
     def get_pdf_preview(self, file_path, max_size=(500, 200)):
         """Get first page preview from PDF file."""
         if not self.pdf_support:
             return None
         
         try:
-            pdf_document = fitz.open(str(file_path))
-            if len(pdf_document) == 0:
-                return None
-            
-            # Get first page
-            first_page = pdf_document[0]
-            
-            # Render page to image (pixmap)
-            zoom = min(max_size[0] / first_page.rect.width, max_size[1] / first_page.rect.height, 2.0)
-            mat = fitz.Matrix(zoom, zoom)
-            pix = first_page.get_pixmap(matrix=mat)
-            
-            # Convert to PIL Image
-            img_data = pix.tobytes("ppm")
-            img = Image.open(io.BytesIO(img_data))
+            # Close the document straight away so the file can be deleted or moved
+            with self._pdf_lock, fitz.open(file_path) as pdf_document:
+                if len(pdf_document) == 0:
+                    return None
+                
+                # Get first page
+                first_page = pdf_document[0]
+                
+                # Render page straight at the target resolution
+                zoom = min(max_size[0] / first_page.rect.width, max_size[1] / first_page.rect.height, 2.0)
+                pix = first_page.get_pixmap(dpi=max(1, int(72 * zoom)), alpha=False)
+                
+                # Wrap the pixmap samples directly instead of round-tripping through PPM
+                img = Image.frombuffer(
+                    'RGB',
+                    (pix.width, pix.height),
+                    pix.samples, 'raw', 'RGB', pix.stride, 1
+                ).copy()
             
-            pdf_document.close()
             return img
         except Exception as e:
             return None
     
+    @_cached_preview
     def get_app_icon(self, file_path, max_size=(128, 128)):
         """Extract icon from executable/application file."""
         if not self.icon_support:
             return None
         
+        if SHELL_IMAGE_SUPPORT:
+            img = self._get_shell_image(file_path, max_size)
+            if img is not None:
+                return img
+        
+        if not ICON_SUPPORT:
+            return None
+        
         try:
             # Extract icon using Windows API
             large, small = win32api.ExtractIconEx(str(file_path), 0)
@@ -170,11 +513,83 @@ class PreviewGenerator:
             # If icon extraction fails, return None
             return None
     
+    def _get_shell_image(self, file_path, max_size):
+        """
+        Get the Explorer thumbnail/icon for a file via IShellItemImageFactory.
+        
+        The shell serves this from its own cache at the requested size, in a
+        single COM call.
+        
+        Returns:
+            PIL Image, or None if the shell could not provide one
+        """
+        # COM must be initialized on each worker thread (S_FALSE if it already is)
+        com_hr = _ole32.CoInitializeEx(None, 0x2)  # COINIT_APARTMENTTHREADED
+        factory = ctypes.c_void_p()
+        hbitmap = wintypes.HBITMAP()
+        hdc = None
+        try:
+            hr = _shell32.SHCreateItemFromParsingName(
+                str(file_path), None, ctypes.byref(_IID_IShellItemImageFactory), ctypes.byref(factory)
+            )
+            if hr != 0 or not factory:
+                return None
+            
+            # SIIGBF_BIGGERSIZEOK: accept a larger cached image and shrink it ourselves
+            _GetImage(factory, wintypes.SIZE(*max_size), 0x1, ctypes.byref(hbitmap))
+            
+            # Query the bitmap size, then read it as top-down 32bpp BGRA
+            hdc = _user32.GetDC(None)
+            header = _BITMAPINFOHEADER(biSize=ctypes.sizeof(_BITMAPINFOHEADER))
+            if not _gdi32.GetDIBits(hdc, hbitmap, 0, 0, None, ctypes.byref(header), 0):
+                return None
+            width, height = header.biWidth, abs(header.biHeight)
+            header.biHeight = -height
+            header.biBitCount = 32
+            header.biCompression = 0  # BI_RGB
+            buffer = ctypes.create_string_buffer(width * height * 4)
+            if not _gdi32.GetDIBits(hdc, hbitmap, 0, height, buffer, ctypes.byref(header), 0):
+                return None
+            
+            img = Image.frombuffer('RGBA', (width, height), buffer.raw, 'raw', 'BGRA', 0, 1)
+            
+            # Flatten transparency onto white, ignoring an unused (all zero) alpha channel
+            if img.getextrema()[3] == (0, 0):
+                img = img.convert('RGB')
+            else:
+                background = Image.new('RGBA', img.size, (255, 255, 255, 255))
+                img = Image.alpha_composite(background, img).convert('RGB')
+            
+            if img.size[0] > max_size[0] or img.size[1] > max_size[1]:
+                img.thumbnail(max_size, Image.Resampling.LANCZOS)
+            
+            return img
+        except OSError:
+            return None
+        finally:
+            if hdc:
+                _user32.ReleaseDC(None, hdc)
+            if hbitmap:
+                _gdi32.DeleteObject(hbitmap)
+            if factory:
+                _Release(factory)
+            if com_hr >= 0:
+                _ole32.CoUninitialize()
+    
+    @_cached_preview
     def get_video_preview(self, file_path, max_size=(500, 200)):
         """Get preview frame from video file."""
         if not self.video_support:
             return None
         
+        if self.ffmpeg_path:
+            img = self._get_ffmpeg_frame(file_path, max_size)
+            if img is not None:
+                return img
+        
+        if not VIDEO_SUPPORT:
+            return None
+        
         try:
             # Open video file
             cap = cv2.VideoCapture(str(file_path))
@@ -206,18 +621,183 @@ class PreviewGenerator:
         except Exception as e:
             return None
     
-    def get_file_preview_image(self, file_path):
-        """Get preview image based on file type."""
-        if self.is_image_file(file_path):
-            return self.get_image_preview(file_path)
-        elif self.is_pdf_file(file_path):
-            return self.get_pdf_preview(file_path)
-        elif self.is_video_file(file_path):
-            return self.get_video_preview(file_path)
-        elif self.is_executable_file(file_path):
-            return self.get_app_icon(file_path)
-        else:
-            return None
+    def _get_ffmpeg_frame(self, file_path, max_size):
+        """
+        Grab an already-scaled frame from a video with ffmpeg.
+        
+        Seeks to ~1 second (keyframe seek before -i is cheap) and lets ffmpeg's
+        scale filter shrink the frame, falling back to the first frame for very
+        short clips.
+        
+        Returns:
+            PIL Image, or None if ffmpeg could not produce a frame
+        """
+        scale = f"scale={max_size[0]}:{max_size[1]}:force_original_aspect_ratio=decrease"
+        
+        for seek in ("1", "0"):
+            try:
+                result = subprocess.run(
+                    [
+                        self.ffmpeg_path, "-v", "error", "-nostdin",
+                        "-ss", seek, "-i", str(file_path),
+                        "-vf", scale, "-frames:v", "1",
+                        "-f", "image2pipe", "-vcodec", "mjpeg", "-"
+                    ],
+                    capture_output=True,
+                    timeout=10,
+                    # Don't flash a console window from the windowed app
+                    creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0)
+                )
+            except (OSError, subprocess.SubprocessError):
+                return None
+            
+            if result.stdout:
+                try:
+                    img = Image.open(io.BytesIO(result.stdout))
+                    img.load()
+                    return img
+                except OSError:
+                    return None
+        
+        return None
+    
+    def get_file_preview_image(self, file_path, max_size=None):
+        """
+        Get preview image based on file type.
+        
+        Args:
+            file_path: Path to the file
+            max_size: Optional (width, height) the preview must fit in. Each
+                file type has its own default when omitted.
+            
+        Returns:
+            PIL Image or None
+        """
+        get_preview = self._dispatch.get(_extension(file_path))
+        return get_preview(file_path, max_size) if get_preview else None
+    
+    def submit_preview(self, file_path, callback=None, key=None, max_size=None):
+        """
+        Generate a preview on the worker pool.
+        
+        Args:
+            file_path: Path to the file
+            callback: Optional callable invoked with the preview image (or None)
+                once it is ready. It runs on a worker thread.
+            key: Optional owner of the request (e.g. a widget). A previous
+                request with the same key is cancelled if it hasn't started yet.
+            max_size: Optional (width, height) the preview must fit in
+            
+        Returns:
+            concurrent.futures.Future resolving to a PIL Image or None
+        """
+        if key is not None:
+            self.cancel_preview(key)
+        
+        future = self._pool.submit(self.get_file_preview_image, file_path, max_size)
+        if key is not None:
+            self._pending[key] = future
+        
+        if callback is not None:
+            def on_done(done_future):
+                if not done_future.cancelled():
+                    callback(done_future.result())
+            future.add_done_callback(on_done)
+        
+        return future
+    
+    def cancel_preview(self, key):
+        """Cancel the pending preview request for a key, if any."""
+        future = self._pending.pop(key, None)
+        if future is not None:
+            future.cancel()
+    
+    def request(self, file_path, priority, callback=None, max_size=None):
+        """
+        Queue a background preview, e.g. to pre-warm the cache for nearby files.
+        
+        Args:
+            file_path: Path to the file
+            priority: Lower runs first (e.g. distance from the current file)
+            callback: Optional callable invoked on a worker thread with the
+                preview image (or None)
+            max_size: Optional (width, height) the preview must fit in
+            
+        Returns:
+            True if the job was queued, False if the queue is full
+        """
+        if self._scheduler is None:
+            self._scheduler = threading.Thread(
+                target=self._run_scheduler, name="preview-scheduler", daemon=True
+            )
+            self._scheduler.start()
+        
+        try:
+            self._queue.put_nowait(
+                (priority, next(self._queue_order), file_path, callback, max_size)
+            )
+            return True
+        except queue.Full:
+            return False
+    
+    def cancel_all_but(self, keep_paths):
+        """
+        Drop queued and not-yet-started preview requests for other files.
+        
+        Args:
+            keep_paths: Paths whose requests should be kept
+        """
+        keep_paths = set(keep_paths)
+        
+        kept = []
+        while True:
+            try:
+                job = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if job[2] in keep_paths:
+                kept.append(job)
+        for job in kept:
+            try:
+                self._queue.put_nowait(job)
+            except queue.Full:
+                break
+        
+        # Cancel outside the lock: cancel() runs the done callback, which takes it
+        with self._requested_lock:
+            stale = [
+                future for file_path, future in self._requested.items()
+                if file_path not in keep_paths
+            ]
+        for future in stale:
+            future.cancel()
+    
+    def _run_scheduler(self):
+        """Feed queued requests to the pool, highest priority first."""
+        while True:
+            self._free_workers.acquire()
+            _, _, file_path, callback, max_size = self._queue.get()
+            
+            try:
+                future = self._pool.submit(self.get_file_preview_image, file_path, max_size)
+            except RuntimeError:
+                # The pool was shut down (e.g. at interpreter exit)
+                return
+            with self._requested_lock:
+                self._requested[file_path] = future
+            future.add_done_callback(
+                lambda done_future, file_path=file_path, callback=callback:
+                    self._finish_request(file_path, done_future, callback)
+            )
+    
+    def _finish_request(self, file_path, future, callback):
+        """Release the worker slot for a finished request and run its callback."""
+        self._free_workers.release()
+        with self._requested_lock:
+            if self._requested.get(file_path) is future:
+                del self._requested[file_path]
+        if callback is not None and not future.cancelled():
+            callback(future.result())
     
     def get_preview_error_message(self, file_path):
         """
@@ -229,19 +809,20 @@ class PreviewGenerator:
         Returns:
             Error message string
         """
-        if self.is_image_file(file_path):
+        kind = _EXT_KIND.get(_extension(file_path))
+        if kind == 'image':
             return "Image preview not available"
-        elif self.is_pdf_file(file_path):
+        elif kind == 'pdf':
             if not self.pdf_support:
                 return "PDF preview not available\n(Install PyMuPDF for PDF support)"
             else:
                 return "PDF preview not available"
-        elif self.is_video_file(file_path):
+        elif kind == 'video':
             if not self.video_support:
-                return "Video preview not available\n(Install opencv-python for video support)"
+                return "Video preview not available\n(Install ffmpeg or opencv-python for video support)"
             else:
                 return "Video preview not available"
-        elif self.is_executable_file(file_path):
+        elif kind == 'exe':
             if not self.icon_support:
                 return "App icon not available\n(Install pywin32 for icon support)"
             else:
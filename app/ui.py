@@ -4,40 +4,91 @@ Contains the DownloadReviewer class that handles all user interface logic.
 """
 
 import customtkinter as ctk
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from tkinter import filedialog, messagebox
-from app.file_manager import FileManager
+from app.file_manager import FileManager, FileRow
 from app.preview_generator import PreviewGenerator
 from PIL import ImageTk
-import config
+from config import CONFIG
 
 
 class DownloadReviewer:
     """Main UI class for the Download Reviewer application."""
     
+    # Number of decoded preview images kept for revisiting files
+    _PREVIEW_CACHE_MAX = 32
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Download Reviewer")
-        self.root.geometry(config.WINDOW_SIZE)
+        self.root.geometry(CONFIG.window_size)
         
         # Initialize FileManager and PreviewGenerator
         self.file_manager = FileManager()
         self.preview_generator = PreviewGenerator()
         
-        # Get files from configured hours threshold
+        # Files are filled in by the background scan started below
+        self.files_to_review = []
+        self.current_index = 0
+        self._update_total_text()
+        
+        # Per-file cache so navigating back to a file skips the decode. Previews
+        # are PhotoImages, so Tk's pixel upload is reused too.
+        self._preview_cache = OrderedDict()
+        
+        # Previews prefetched for the neighbors of the current file, filled in
+        # from PreviewGenerator's worker threads
+        self._warm_previews = {}
+        # Neighbor paths set by the UI thread, read by workers under _warm_lock
+        self._warm_neighbors = frozenset()
+        self._warm_lock = threading.Lock()
+        
+        # Path of the file whose info and preview are on screen
+        self._displayed_path = None
+        
+        # Create UI
+        self.create_ui()
+        
+        # Scan the Downloads folder off the main thread so the window appears
+        # straight away, even for a very large folder
+        self.scanning_label = ctk.CTkLabel(
+            self.content_frame,
+            text="Scanning Downloads folder...",
+            font=ctk.CTkFont(size=14)
+        )
+        self.scanning_label.pack(pady=50)
+        self.root.after(50, self._start_background_scan)
+    
+    def _start_background_scan(self):
+        """Scan for recent files on a worker thread."""
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(self.file_manager.get_recent_files, hours=CONFIG.hours_threshold)
+        executor.shutdown(wait=False)
+        self._poll_scan_result(future)
+    
+    def _poll_scan_result(self, future):
+        """
+        Show the first file once the background scan has finished.
+        
+        Args:
+            future: Future resolving to the list of files to review
+        """
+        if not future.done():
+            self.root.after(100, self._poll_scan_result, future)
+            return
+        
         try:
-            self.files_to_review = self.file_manager.get_recent_files(hours=config.HOURS_THRESHOLD)
-        except FileNotFoundError as e:
-            messagebox.showerror("Error", str(e))
-            self.files_to_review = []
+            self.files_to_review = future.result()
         except Exception as e:
             messagebox.showerror("Error", str(e))
             self.files_to_review = []
         
+        self.scanning_label.destroy()
         self.current_index = 0
-        
-        # Create UI
-        self.create_ui()
+        self._update_total_text()
         
         # Show first file or completion message
         if self.files_to_review:
@@ -51,8 +102,9 @@ class DownloadReviewer:
         self.main_frame = ctk.CTkFrame(self.root)
         self.main_frame.pack(fill="both", expand=True, padx=20, pady=20)
         
-        # Content area (scrollable if needed)
-        self.content_frame = ctk.CTkScrollableFrame(self.main_frame)
+        # Content area. A plain frame: the single-file view has a fixed layout
+        # (long names wrap), so it doesn't need a canvas-backed scrollable frame.
+        self.content_frame = ctk.CTkFrame(self.main_frame)
         self.content_frame.pack(fill="both", expand=True, pady=(0, 10))
         
         # Title
@@ -63,6 +115,32 @@ class DownloadReviewer:
         )
         self.title_label.pack(pady=(10, 20))
         
+        # Fixed bottom section for buttons (always visible)
+        self.bottom_frame = ctk.CTkFrame(self.main_frame)
+        self.bottom_frame.pack(side="bottom", fill="x", pady=(10, 0))
+        
+        # The review and completion widgets are built on first use, so the
+        # "All Clean" case never creates the review widgets at all
+        self.info_frame = None
+        self.completion_label = None
+        
+        # Keyboard shortcuts for the review actions
+        for sequence, action in (
+            ("<Delete>", self.delete_file),
+            ("<Right>", self.next_file),
+            ("<Left>", self.previous_file),
+            ("<Return>", self.keep_file),
+            ("<m>", self.move_file),
+        ):
+            self.root.bind(sequence, lambda event, action=action: self._on_shortcut(action))
+    
+    def _on_shortcut(self, action):
+        """Run a review action from a key press, unless no file is being shown."""
+        if self.current_index < len(self.files_to_review):
+            action()
+    
+    def _create_review_ui(self):
+        """Create the file info, preview, progress and button widgets."""
         # File info frame
         self.info_frame = ctk.CTkFrame(self.content_frame)
         self.info_frame.pack(fill="x", pady=(0, 10))
@@ -139,10 +217,6 @@ class DownloadReviewer:
         )
         self.progress_label.pack(pady=(5, 5))
         
-        # Fixed bottom section for buttons (always visible)
-        self.bottom_frame = ctk.CTkFrame(self.main_frame)
-        self.bottom_frame.pack(side="bottom", fill="x", pady=(10, 0))
-        
         # Navigation buttons frame
         self.nav_frame = ctk.CTkFrame(self.bottom_frame)
         self.nav_frame.pack(anchor="center", pady=(10, 5))
@@ -212,85 +286,237 @@ class DownloadReviewer:
             self.show_all_clean()
             return
         
-        # Remove files that no longer exist from the list
-        self.files_to_review = [f for f in self.files_to_review if f.exists()]
+        if self.info_frame is None:
+            self._create_review_ui()
         
-        # Adjust index if it's now out of bounds
-        if self.current_index >= len(self.files_to_review):
-            if len(self.files_to_review) == 0:
-                self.show_all_clean()
-                return
-            self.current_index = len(self.files_to_review) - 1
-        
-        if self.current_index < 0:
-            self.current_index = 0
-        
-        current_file = self.files_to_review[self.current_index]
+        # Re-showing the file already on screen only needs the progress and
+        # buttons refreshed, not the labels and preview
+        if self.files_to_review[self.current_index].path == self._displayed_path:
+            self._update_controls()
+            return
         
-        try:
-            # Get file info using FileManager
-            file_info = self.file_manager.get_file_info(current_file)
+        # Find a file that can be shown, skipping ones that have disappeared or
+        # can't be read. Only the file about to be shown is checked, rather than
+        # stat'ing the whole list, and it's a loop so a long run of bad files
+        # can't hit the recursion limit.
+        while True:
+            # Adjust index if it's now out of bounds
+            if self.current_index >= len(self.files_to_review):
+                if len(self.files_to_review) == 0:
+                    self.show_all_clean()
+                    return
+                self.current_index = len(self.files_to_review) - 1
             
-            # Update UI
-            self.file_name_value.configure(text=current_file.name)
-            self.file_size_value.configure(text=file_info['size_formatted'])
-            self.creation_time_value.configure(text=file_info['creation_time_str'])
+            if self.current_index < 0:
+                self.current_index = 0
             
-            # Update preview
-            preview_img = self.preview_generator.get_file_preview_image(current_file)
-            if preview_img:
-                # Convert PIL Image to PhotoImage
-                preview_img_tk = ImageTk.PhotoImage(preview_img)
-                self.preview_image = preview_img_tk  # Keep reference
-                self.preview_image_label.configure(image=preview_img_tk, text="")
-            else:
-                # No preview available
-                self.preview_image = None
-                message = self.preview_generator.get_preview_error_message(current_file)
-                self.preview_image_label.configure(
-                    image=None,
-                    text=message
-                )
+            current_row = self.files_to_review[self.current_index]
+            current_file = Path(current_row.path)
             
-            # Update progress
-            progress_text = f"File {self.current_index + 1} of {len(self.files_to_review)}"
-            self.progress_label.configure(text=progress_text)
+            try:
+                # Refresh the row from this stat, so e.g. a download that was
+                # still being written shows its current size
+                file_stat = current_file.stat()
+                current_row = FileRow(current_row.path, file_stat.st_size, file_stat.st_ctime_ns)
+                self.files_to_review[self.current_index] = current_row
+                
+                # Get file info using FileManager
+                file_info = self.file_manager.get_file_info(current_row)
+                break
+            except FileNotFoundError:
+                # Deleted or moved outside the app since the scan
+                pass
+            except (OSError, PermissionError) as e:
+                messagebox.showerror(
+                    "Error",
+                    f"Cannot access file: {current_file.name}\n{str(e)}"
+                )
             
-            # Enable/disable navigation buttons
-            self.prev_button.configure(state="normal" if self.current_index > 0 else "disabled")
-            self.next_button.configure(state="normal" if self.current_index < len(self.files_to_review) - 1 else "disabled")
+            # Skip this file
+            self._remove_current_file()
+        
+        # Update UI (each CTk configure redraws, so skip unchanged values)
+        self._configure_if_changed(self.file_name_value, text=current_file.name)
+        self._configure_if_changed(self.file_size_value, text=file_info['size_formatted'])
+        self._configure_if_changed(self.creation_time_value, text=file_info['creation_time_str'])
+        
+        # Update preview, reusing the PhotoImage if this file was shown before
+        cached_preview = self._preview_cache.get(current_row.path)
+        with self._warm_lock:
+            warm_preview = self._warm_previews.pop(current_row.path, None)
+        if cached_preview is not None:
+            self._preview_cache.move_to_end(current_row.path)
+            self.preview_generator.cancel_preview(self.preview_image_label)
+            self.preview_image = cached_preview
+            self.preview_image_label.configure(image=cached_preview, text="")
+        elif warm_preview is not None:
+            # Prefetched in the background; only the PhotoImage is made here
+            self.preview_generator.cancel_preview(self.preview_image_label)
+            self._display_preview(warm_preview, current_file)
+        else:
+            # Generate it in the background so decoding doesn't block the window
+            self.preview_image = None
+            self.preview_image_label.configure(image=None, text="Loading preview...")
+            future = self.preview_generator.submit_preview(
+                current_file, key=self.preview_image_label,
+                max_size=CONFIG.preview_max_size
+            )
+            self._poll_preview(future, current_file)
+        
+        self._update_controls()
+        self._displayed_path = current_row.path
+        
+        self._prefetch_neighbors()
+    
+    def _update_controls(self):
+        """Update the progress text and button states for the current index."""
+        # Update progress
+        progress_text = f"File {self.current_index + 1}{self._total_text}"
+        self._configure_if_changed(self.progress_label, text=progress_text)
+        
+        # Enable/disable navigation buttons
+        self._configure_if_changed(
+            self.prev_button,
+            state="normal" if self.current_index > 0 else "disabled"
+        )
+        self._configure_if_changed(
+            self.next_button,
+            state="normal" if self.current_index < len(self.files_to_review) - 1 else "disabled"
+        )
+        
+        # Enable action buttons
+        self._configure_if_changed(self.delete_button, state="normal")
+        self._configure_if_changed(self.keep_button, state="normal")
+        self._configure_if_changed(self.move_button, state="normal")
+    
+    def _update_total_text(self):
+        """Precompute the " of N" progress suffix; call when the list length changes."""
+        self._total_text = f" of {len(self.files_to_review)}"
+    
+    @staticmethod
+    def _configure_if_changed(widget, **options):
+        """Configure only the options whose value differs, avoiding needless CTk redraws."""
+        changed = {name: value for name, value in options.items() if widget.cget(name) != value}
+        if changed:
+            widget.configure(**changed)
+    
+    def _poll_preview(self, future, file_path):
+        """Wait for a background preview and show it if the file is still current."""
+        if future.cancelled():
+            return
+        if not future.done():
+            self.root.after(30, self._poll_preview, future, file_path)
+            return
+        
+        # Ignore results for files the user has already moved past
+        if (self.current_index >= len(self.files_to_review)
+                or self.files_to_review[self.current_index].path != str(file_path)):
+            return
+        
+        self._display_preview(future.result(), file_path)
+    
+    def _display_preview(self, preview_img, file_path):
+        """Show a PIL preview image (or the error message if None) for the current file."""
+        if preview_img:
+            # Make room in the cache first. When the PhotoImage dropped from it is
+            # the same size, its pixels are replaced in place instead of
+            # creating a new Tk image.
+            preview_img_tk = None
+            path_key = str(file_path)
+            if path_key not in self._preview_cache and len(self._preview_cache) >= self._PREVIEW_CACHE_MAX:
+                _, evicted = self._preview_cache.popitem(last=False)
+                if evicted is not self.preview_image and (evicted.width(), evicted.height()) == preview_img.size:
+                    evicted.paste(preview_img)
+                    preview_img_tk = evicted
             
-            # Enable action buttons
-            self.delete_button.configure(state="normal")
-            self.keep_button.configure(state="normal")
-            self.move_button.configure(state="normal")
+            # Convert PIL Image to PhotoImage
+            if preview_img_tk is None:
+                preview_img_tk = ImageTk.PhotoImage(preview_img)
+            self.preview_image = preview_img_tk  # Keep reference
+            self.preview_image_label.configure(image=preview_img_tk, text="")
             
-        except (OSError, PermissionError) as e:
-            messagebox.showerror(
-                "Error",
-                f"Cannot access file: {current_file.name}\n{str(e)}"
+            self._preview_cache[path_key] = preview_img_tk
+        else:
+            # No preview available
+            self.preview_image = None
+            message = self.preview_generator.get_preview_error_message(file_path)
+            self.preview_image_label.configure(
+                image=None,
+                text=message
             )
-            # Skip this file and move to next
-            self.current_index += 1
-            self.show_current_file()
+    
+    def _neighbor_paths(self):
+        """Paths of the files just after and before the current one."""
+        return [
+            self.files_to_review[index].path
+            for index in (self.current_index + 1, self.current_index - 1)
+            if 0 <= index < len(self.files_to_review)
+        ]
+    
+    def _prefetch_neighbors(self):
+        """Generate previews for the neighboring files in the background."""
+        neighbors = self._neighbor_paths()
+        current_path = self.files_to_review[self.current_index].path
+        
+        # Drop queued work and prefetched images for files no longer nearby
+        self.preview_generator.cancel_all_but([current_path, *neighbors])
+        with self._warm_lock:
+            self._warm_neighbors = frozenset(neighbors)
+            for path in list(self._warm_previews):
+                if path not in self._warm_neighbors:
+                    del self._warm_previews[path]
+        
+        for priority, path in enumerate(neighbors, start=1):
+            if path not in self._preview_cache and path not in self._warm_previews:
+                self.preview_generator.request(
+                    path, priority,
+                    lambda preview_img, path=path: self._store_warm_preview(path, preview_img),
+                    max_size=CONFIG.preview_max_size
+                )
+    
+    def _store_warm_preview(self, file_path, preview_img):
+        """Keep a prefetched preview if its file is still a neighbor (runs on a worker thread)."""
+        if preview_img is None:
+            return
+        with self._warm_lock:
+            if file_path in self._warm_neighbors:
+                self._warm_previews[file_path] = preview_img
+    
+    def _remove_current_file(self):
+        """Remove the current file from the review list and its caches."""
+        # Sequential review usually removes from the end of the list
+        if self.current_index == len(self.files_to_review) - 1:
+            removed = self.files_to_review.pop()
+        else:
+            removed = self.files_to_review.pop(self.current_index)
+        self._forget_file(removed.path)
+        self._displayed_path = None
+        self._update_total_text()
+        
+        # Adjust index if needed (don't increment if we're at the end)
+        if self.current_index >= len(self.files_to_review) and self.current_index > 0:
+            self.current_index = len(self.files_to_review) - 1
+    
+    def _forget_file(self, file_path):
+        """Drop the cached preview for a file that was deleted or moved."""
+        self._preview_cache.pop(str(file_path), None)
+        with self._warm_lock:
+            self._warm_previews.pop(str(file_path), None)
     
     def delete_file(self):
         """Delete the current file to Recycle Bin."""
         if self.current_index >= len(self.files_to_review):
             return
         
-        current_file = self.files_to_review[self.current_index]
+        current_file = Path(self.files_to_review[self.current_index].path)
         
         try:
             self.file_manager.delete_file(current_file)
+            self.preview_generator.forget(current_file)
             messagebox.showinfo("Success", f"'{current_file.name}' moved to Recycle Bin")
             
             # Remove deleted file from the list
-            self.files_to_review.pop(self.current_index)
-            
-            # Adjust index if needed (don't increment if we're at the end)
-            if self.current_index >= len(self.files_to_review) and self.current_index > 0:
-                self.current_index = len(self.files_to_review) - 1
+            self._remove_current_file()
             
             self.show_current_file()
         except PermissionError as e:
@@ -320,19 +546,18 @@ class DownloadReviewer:
         if self.current_index >= len(self.files_to_review):
             return
         
-        current_file = self.files_to_review[self.current_index]
+        current_file = Path(self.files_to_review[self.current_index].path)
         
         try:
             # Open folder selection dialog
             destination = filedialog.askdirectory(title="Select destination folder")
             
             if destination:
-                destination_path = Path(destination)
-                
-                # Check if file already exists in destination
-                overwrite = False
-                destination_file = destination_path / current_file.name
-                if destination_file.exists():
+                # Move the file using FileManager. It reports an existing file
+                # itself, which saves a stat of the destination up front.
+                try:
+                    self.file_manager.move_file(current_file, destination)
+                except FileExistsError:
                     response = messagebox.askyesno(
                         "File Exists",
                         f"'{current_file.name}' already exists in the destination folder. "
@@ -340,21 +565,15 @@ class DownloadReviewer:
                     )
                     if not response:
                         return
-                    overwrite = True
-                
-                # Move the file using FileManager
-                self.file_manager.move_file(current_file, destination_path, overwrite=overwrite)
+                    self.file_manager.move_file(current_file, destination, overwrite=True)
+                self.preview_generator.forget(current_file)
                 messagebox.showinfo(
                     "Success",
                     f"'{current_file.name}' moved to:\n{destination}"
                 )
                 
                 # Remove moved file from the list (it's no longer in Downloads)
-                self.files_to_review.pop(self.current_index)
-                
-                # Adjust index if needed (don't increment if we're at the end)
-                if self.current_index >= len(self.files_to_review) and self.current_index > 0:
-                    self.current_index = len(self.files_to_review) - 1
+                self._remove_current_file()
                 
                 self.show_current_file()
         except PermissionError as e:
@@ -366,18 +585,27 @@ class DownloadReviewer:
     
     def show_all_clean(self):
         """Show the 'All Clean!' message when there are no more files."""
-        # Hide file info
-        self.info_frame.pack_forget()
-        
-        # Hide buttons (but keep bottom frame visible)
-        self.nav_frame.pack_forget()
-        self.buttons_frame.pack_forget()
-        self.progress_label.pack_forget()
+        self._displayed_path = None
         
-        # Clear preview
-        self.preview_image = None
-        self.preview_image_label.configure(image=None, text="")
+        if self.info_frame is not None:
+            # Hide file info
+            self.info_frame.pack_forget()
+            
+            # Hide buttons (but keep bottom frame visible)
+            self.nav_frame.pack_forget()
+            self.buttons_frame.pack_forget()
+            self.progress_label.pack_forget()
+            
+            # Clear preview
+            self.preview_generator.cancel_preview(self.preview_image_label)
+            self.preview_image = None
+            self.preview_image_label.configure(image=None, text="")
         
+        if self.completion_label is None:
+            self._create_completion_ui()
+    
+    def _create_completion_ui(self):
+        """Create the 'All Clean!' message and Close button."""
         # Show completion message in content frame
         self.completion_label = ctk.CTkLabel(
             self.content_frame,
@@ -389,7 +617,7 @@ class DownloadReviewer:
         
         self.completion_subtitle = ctk.CTkLabel(
             self.content_frame,
-            text="No files from the last 24 hours to review.",
+            text=f"No files from the last {CONFIG.hours_threshold} hours to review.",
             font=ctk.CTkFont(size=14)
         )
         self.completion_subtitle.pack(pady=(10, 30))
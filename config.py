@@ -3,14 +3,33 @@ Configuration file for Download Reviewer.
 Contains all configurable constants and settings.
 """
 
+import os
+from dataclasses import dataclass, field
 from pathlib import Path
 
-# File scanning configuration
-HOURS_THRESHOLD = 24
 
-# Paths configuration
-DOWNLOADS_PATH = Path.home() / "Downloads"
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Application settings. Read through the CONFIG instance below."""
+    
+    # File scanning configuration
+    hours_threshold: int = 24
+    
+    # Paths configuration
+    downloads_path: Path = field(default_factory=lambda: Path.home() / "Downloads")
+    
+    # On-disk cache for generated preview thumbnails
+    thumbnail_cache_path: Path = field(
+        default_factory=lambda: (
+            Path(os.environ.get("LOCALAPPDATA", Path.home() / ".cache")) / "download-reviewer" / "thumbs"
+        )
+    )
+    
+    # UI configuration
+    window_size: str = "800x750"
+    
+    # Previews are decoded and scaled to fit the preview area (width, height)
+    preview_max_size: tuple = (550, 200)
 
-# UI configuration
-WINDOW_SIZE = "800x750"
 
+CONFIG = Config()
@@ -0,0 +1,112 @@
+"""
+Tests for FileManager.move_file.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from app.file_manager import FileManager
+
+
+class MoveFileTests(unittest.TestCase):
+    """Same-volume and cross-volume moves, with and without overwrite."""
+    
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        
+        self.downloads = self.root / "Downloads"
+        self.destination = self.root / "Sorted"
+        self.downloads.mkdir()
+        self.destination.mkdir()
+        
+        self.source = self.downloads / "report.txt"
+        self.source.write_text("new")
+        self.file_manager = FileManager(self.downloads)
+    
+    def _other_device(self):
+        """Make the destination folder look like it is on another volume."""
+        real_stat = Path.stat
+        destination = self.destination
+        
+        def fake_stat(path, *args, **kwargs):
+            result = real_stat(path, *args, **kwargs)
+            if path == destination:
+                fields = list(result)
+                fields[2] = result.st_dev + 1  # st_dev
+                result = os.stat_result(fields)
+            return result
+        
+        return mock.patch.object(Path, "stat", fake_stat)
+    
+    def test_same_volume_move(self):
+        moved = self.file_manager.move_file(self.source, self.destination)
+        
+        self.assertEqual(moved, self.destination / "report.txt")
+        self.assertEqual(moved.read_text(), "new")
+        self.assertFalse(self.source.exists())
+    
+    def test_same_volume_existing_file_raises(self):
+        existing = self.destination / "report.txt"
+        existing.write_text("old")
+        
+        with self.assertRaises(FileExistsError):
+            self.file_manager.move_file(self.source, self.destination)
+        
+        self.assertEqual(existing.read_text(), "old")
+        self.assertEqual(self.source.read_text(), "new")
+        self.assertEqual(sorted(os.listdir(self.destination)), ["report.txt"])
+    
+    def test_same_volume_overwrite(self):
+        (self.destination / "report.txt").write_text("old")
+        
+        moved = self.file_manager.move_file(self.source, self.destination, overwrite=True)
+        
+        self.assertEqual(moved.read_text(), "new")
+        self.assertFalse(self.source.exists())
+    
+    def test_cross_volume_move_uses_shutil(self):
+        with self._other_device(), \
+                mock.patch.object(FileManager, "_rename_file") as rename, \
+                mock.patch("app.file_manager.shutil.move", wraps=shutil.move) as move:
+            moved = self.file_manager.move_file(self.source, self.destination)
+        
+        rename.assert_not_called()
+        move.assert_called_once()
+        self.assertEqual(moved.read_text(), "new")
+        self.assertFalse(self.source.exists())
+    
+    def test_cross_volume_existing_file_raises(self):
+        existing = self.destination / "report.txt"
+        existing.write_text("old")
+        
+        with self._other_device(), self.assertRaises(FileExistsError):
+            self.file_manager.move_file(self.source, self.destination)
+        
+        self.assertEqual(existing.read_text(), "old")
+        self.assertEqual(self.source.read_text(), "new")
+    
+    def test_cross_volume_overwrite(self):
+        (self.destination / "report.txt").write_text("old")
+        
+        with self._other_device():
+            moved = self.file_manager.move_file(self.source, self.destination, overwrite=True)
+        
+        self.assertEqual(moved.read_text(), "new")
+        self.assertFalse(self.source.exists())
+    
+    def test_missing_source_raises(self):
+        with self.assertRaises(FileNotFoundError):
+            self.file_manager.move_file(self.downloads / "missing.txt", self.destination)
+    
+    def test_missing_destination_raises(self):
+        with self.assertRaises(FileNotFoundError):
+            self.file_manager.move_file(self.source, self.root / "missing")
+
+
+if __name__ == "__main__":
+    unittest.main()